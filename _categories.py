@@ -0,0 +1,34 @@
+"""Shared expense category constants, serialized once at import."""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Immutable so every importer shares one interned tuple instead of
+# rebuilding a dict + list per module.
+CATEGORIES: tuple[str, ...] = (
+    "Food & Dining",
+    "Transportation",
+    "Shopping",
+    "Entertainment",
+    "Bills & Utilities",
+    "Healthcare",
+    "Travel",
+    "Education",
+    "Business",
+    "Other",
+)
+
+_PAYLOAD = {"categories": list(CATEGORIES)}
+
+if orjson is not None:
+    CATEGORIES_JSON = orjson.dumps(_PAYLOAD).decode()
+    CATEGORIES_JSON_PRETTY = orjson.dumps(
+        _PAYLOAD, option=orjson.OPT_INDENT_2
+    ).decode()
+else:
+    CATEGORIES_JSON = json.dumps(_PAYLOAD, separators=(",", ":"))
+    CATEGORIES_JSON_PRETTY = json.dumps(_PAYLOAD, indent=2)
@@ -1,8 +1,16 @@
 from fastmcp import FastMCP
+import asyncio
+import contextlib
+import functools
 import os
 import aiosqlite
-import json
-import tempfile
+import sqlite3
+import sys
+import threading
+import time
+from datetime import date as _date
+
+from _categories import CATEGORIES_JSON
 
 # ============================================================
 # ENVIRONMENT-SAFE PATHS
@@ -11,52 +19,48 @@ import tempfile
 IS_CLOUD = os.getenv("FASTMCP_CLOUD", "") or os.getenv("MCP_CLOUD", "")
 
 if IS_CLOUD:
-    DB_DIR = tempfile.gettempdir()
+    # Cloud storage is ephemeral anyway, so skip the disk (and every
+    # write fsync) entirely: a shared-cache in-memory database is
+    # visible to all connections in this process and lives as long as
+    # at least one of them stays open.
+    DB_PATH = "file:expenses?mode=memory&cache=shared"
+    DB_URI = True
 else:
     DB_DIR = os.path.dirname(os.path.abspath(__file__))
-
-DB_PATH = os.path.join(DB_DIR, "expenses.db")
+    DB_PATH = os.path.join(DB_DIR, "expenses.db")
+    DB_URI = False
 
 mcp = FastMCP("ExpenseTracker")
 
 # ============================================================
-# DEFAULT CATEGORIES (in-memory, no file dependency)
+# DEFAULT CATEGORIES (shared constants, no file dependency)
 # ============================================================
 
-DEFAULT_CATEGORIES = {
-    "categories": [
-        "Food & Dining",
-        "Transportation",
-        "Shopping",
-        "Entertainment",
-        "Bills & Utilities",
-        "Healthcare",
-        "Travel",
-        "Education",
-        "Business",
-        "Other"
-    ]
-}
+# Resolve the override file once; re-stating a constant path on every
+# resource fetch is wasted syscalls. Cloud never reads the filesystem.
+_CATEGORIES_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "categories.json"
+)
+_CATEGORIES_FILE_EXISTS = not IS_CLOUD and os.path.exists(_CATEGORIES_FILE)
 
 # ============================================================
-# DATABASE INIT (ASYNC - lazy initialization)
+# SCHEMA INIT (eager, at import)
 # ============================================================
 
-_db_initialized = False
+# In cloud mode this connection is kept open for the life of the
+# process so the shared in-memory database is never torn down.
+_mem_keepalive: sqlite3.Connection | None = None
 
-async def ensure_db():
-    """Lazy async database initialization."""
-    global _db_initialized
-    if _db_initialized:
-        return
-    
+def _init_schema():
+    """Create the schema once, synchronously, so tool calls never re-check it."""
+    global _mem_keepalive
     try:
-        async with aiosqlite.connect(DB_PATH) as db:
-            # Don't use WAL in cloud/tmp - it can cause issues
+        conn = sqlite3.connect(DB_PATH, uri=DB_URI)
+        try:
             if not IS_CLOUD:
-                await db.execute("PRAGMA journal_mode=WAL;")
-            
-            await db.execute("""
+                conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS expenses (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     date TEXT NOT NULL,
@@ -66,12 +70,328 @@ async def ensure_db():
                     note TEXT DEFAULT ''
                 )
             """)
-            await db.commit()
-        
-        _db_initialized = True
-        
+            # list_expenses range-scans on date (DESC order); summarize
+            # groups by category within a date range. Both go from full
+            # table scans to index range scans with these.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date DESC)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_expenses_date_category ON expenses(date, category)"
+            )
+            # Populate sqlite_stat1 so the planner prefers the indexes
+            # over full scans once the table grows.
+            conn.execute("ANALYZE expenses;")
+            conn.commit()
+        finally:
+            if IS_CLOUD:
+                _mem_keepalive = conn
+            else:
+                conn.close()
     except Exception as e:
-        raise RuntimeError(f"Database initialization failed: {e}")
+        # Cloud tmp may not be writable yet; the first aiosqlite connect
+        # will surface a clean error if the problem persists.
+        print(f"Warning: database init deferred: {e}", file=sys.stderr)
+
+_init_schema()
+
+# ============================================================
+# DATABASE CONNECTION (shared, long-lived)
+# ============================================================
+
+# Opening a connection per tool call spins up a worker thread and re-reads
+# the database header every time. Open once, reuse everywhere.
+_db: aiosqlite.Connection | None = None
+_db_lock = asyncio.Lock()
+
+# Serializes explicit BEGIN...COMMIT batches on the shared RW
+# connection. Without it, two concurrent batches interleave on the same
+# connection and the second BEGIN fails mid-transaction; it also keeps
+# the contiguous-rowid math after executemany correct.
+_batch_lock = asyncio.Lock()
+
+async def get_db() -> aiosqlite.Connection:
+    """Return the shared database connection, creating it on first use."""
+    global _db
+
+    # Fast path: once set, the connection never changes, so skip the
+    # lock entirely. Errors propagate with their original tracebacks;
+    # the MCP layer (and each tool's handler) already catches them.
+    if _db is not None:
+        return _db
+
+    async with _db_lock:
+        if _db is not None:
+            return _db
+
+        db = await aiosqlite.connect(DB_PATH, uri=DB_URI)
+
+        # Don't use WAL in cloud/tmp - it can cause issues
+        if not IS_CLOUD:
+            await db.execute("PRAGMA journal_mode=WAL;")
+            await db.execute("PRAGMA wal_autocheckpoint=1000;")
+        # synchronous=NORMAL fsyncs at checkpoints instead of every
+        # commit; the rest keep hot pages and temp data in memory.
+        await db.execute("PRAGMA synchronous=NORMAL;")
+        await db.execute("PRAGMA temp_store=MEMORY;")
+        await db.execute("PRAGMA cache_size=-65536;")
+        await db.execute("PRAGMA mmap_size=268435456;")
+
+        # Row objects are built in C; dict(row) is far cheaper than
+        # zipping column names per row in Python.
+        db.row_factory = aiosqlite.Row
+
+        _db = db
+        return _db
+
+
+# ============================================================
+# SQL STATEMENTS
+# ============================================================
+
+# sqlite3 caches prepared statements per connection, keyed on the exact
+# SQL text. Module-level constants guarantee every call presents the
+# same string, so statements are parsed and planned once.
+_SQL_INSERT_EXPENSE = """
+    INSERT INTO expenses (date, amount, category, subcategory, note)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_DELETE_EXPENSE = "DELETE FROM expenses WHERE id = ?"
+
+_SQL_LIST_EXPENSES = """
+    SELECT id, date, amount, category, subcategory, note
+    FROM expenses
+    WHERE date BETWEEN ? AND ?
+    ORDER BY date DESC
+    LIMIT ? OFFSET ?
+"""
+
+# The scalar subquery over the CTE returns the grand total alongside
+# the per-category rows, so no second pass is needed in Python.
+_SQL_SUMMARIZE = """
+    WITH s AS (
+        SELECT category, SUM(amount) AS total, COUNT(*) AS count
+        FROM expenses
+        WHERE date BETWEEN ? AND ?
+        GROUP BY category
+    )
+    SELECT category, total, count, (SELECT SUM(total) FROM s) AS grand_total
+    FROM s ORDER BY total DESC
+"""
+
+_SQL_SUMMARIZE_BY_CATEGORY = """
+    WITH s AS (
+        SELECT category, SUM(amount) AS total, COUNT(*) AS count
+        FROM expenses
+        WHERE date BETWEEN ? AND ?
+        AND category = ?
+        GROUP BY category
+    )
+    SELECT category, total, count, (SELECT SUM(total) FROM s) AS grand_total
+    FROM s ORDER BY total DESC
+"""
+
+# ============================================================
+# SYNC CONNECTION (tiny single-row writes)
+# ============================================================
+
+# aiosqlite routes every operation through a per-connection worker
+# thread; for a one-row INSERT or DELETE the queue hop costs more than
+# the query. Run those on a shared sync connection under to_thread.
+_sync_conn: sqlite3.Connection | None = None
+_sync_lock = threading.Lock()
+
+def _get_sync_conn() -> sqlite3.Connection:
+    """Return the shared sync connection. Call with _sync_lock held."""
+    global _sync_conn
+    if _sync_conn is None:
+        conn = sqlite3.connect(DB_PATH, uri=DB_URI, check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute("PRAGMA temp_store=MEMORY;")
+        conn.execute("PRAGMA cache_size=-65536;")
+        conn.execute("PRAGMA mmap_size=268435456;")
+        _sync_conn = conn
+    return _sync_conn
+
+def _insert_expense_sync(date, amount, category, subcategory, note):
+    with _sync_lock:
+        conn = _get_sync_conn()
+        cur = conn.execute(
+            _SQL_INSERT_EXPENSE,
+            (date, amount, category, subcategory, note)
+        )
+        conn.commit()
+        return cur.lastrowid
+
+def _delete_expense_sync(expense_id):
+    with _sync_lock:
+        conn = _get_sync_conn()
+        cur = conn.execute(_SQL_DELETE_EXPENSE, (expense_id,))
+        conn.commit()
+        return cur.rowcount
+
+# ============================================================
+# READER POOL (read-only connections for SELECT-heavy tools)
+# ============================================================
+
+# With a single connection, concurrent reads serialize behind writers.
+# In WAL mode SQLite supports one writer plus many readers, so keep a
+# small pool of read-only connections for list/summarize while writes
+# keep using the shared RW connection.
+READER_POOL_SIZE = 4
+
+_reader_pool: asyncio.Queue = asyncio.Queue()
+_readers_opened = 0
+_reader_lock = asyncio.Lock()
+
+# The in-memory database has no mode=ro URI form; PRAGMA query_only
+# below enforces read-only behavior there instead.
+_READER_URI = DB_PATH if IS_CLOUD else f"file:{DB_PATH}?mode=ro"
+
+async def _open_reader() -> aiosqlite.Connection:
+    """Open one read-only connection to the database."""
+    reader = await aiosqlite.connect(_READER_URI, uri=True)
+    await reader.execute("PRAGMA query_only=ON;")
+    if IS_CLOUD:
+        # Shared-cache tables are guarded by table-level locks that
+        # fail immediately with SQLITE_LOCKED (the busy timeout only
+        # retries SQLITE_BUSY). These readers cannot write, so dropping
+        # their read locks only stops them blocking the writers.
+        await reader.execute("PRAGMA read_uncommitted=ON;")
+    # The hot read path runs here, not on _db, so the cache/temp/mmap
+    # tuning has to be applied per reader too.
+    await reader.execute("PRAGMA temp_store=MEMORY;")
+    await reader.execute("PRAGMA cache_size=-65536;")
+    await reader.execute("PRAGMA mmap_size=268435456;")
+    reader.row_factory = aiosqlite.Row
+    return reader
+
+@contextlib.asynccontextmanager
+async def acquire_reader():
+    """Borrow a read-only connection from the pool, opening lazily up to the cap."""
+    global _readers_opened
+
+    try:
+        reader = _reader_pool.get_nowait()
+    except asyncio.QueueEmpty:
+        async with _reader_lock:
+            if _readers_opened < READER_POOL_SIZE:
+                reader = await _open_reader()
+                _readers_opened += 1
+            else:
+                reader = None
+        if reader is None:
+            reader = await _reader_pool.get()
+
+    try:
+        yield reader
+    finally:
+        _reader_pool.put_nowait(reader)
+
+
+async def _close_async_connections():
+    """Close the pooled readers and the shared RW connection."""
+    global _db
+
+    while not _reader_pool.empty():
+        try:
+            await _reader_pool.get_nowait().close()
+        except Exception:
+            pass
+
+    if _db is not None:
+        try:
+            await _db.close()
+        except Exception:
+            pass
+        _db = None
+
+
+def _close_db():
+    """Close the shared connections at interpreter shutdown."""
+    global _readers_opened, _sync_conn, _mem_keepalive
+
+    with _sync_lock:
+        if _sync_conn is not None:
+            try:
+                # Refresh planner statistics cheaply on the way out.
+                _sync_conn.execute("PRAGMA optimize")
+                _sync_conn.close()
+            except Exception:
+                pass
+            _sync_conn = None
+
+    # One event loop for all aiosqlite closes instead of one per
+    # connection; each close joins that connection's worker thread.
+    try:
+        asyncio.run(_close_async_connections())
+    except Exception:
+        pass
+    _readers_opened = 0
+
+    # Last out: closing this drops the in-memory database in cloud mode.
+    if _mem_keepalive is not None:
+        try:
+            _mem_keepalive.close()
+        except Exception:
+            pass
+        _mem_keepalive = None
+
+# aiosqlite workers are non-daemon threads, and CPython joins those
+# *before* running atexit callbacks - a plain atexit hook would never
+# fire and exit would deadlock on the parked workers. threading's own
+# atexit list runs first, before the join.
+threading._register_atexit(_close_db)
+
+# ============================================================
+# SUMMARY CACHE (invalidated by writes)
+# ============================================================
+
+# Dashboard-style summaries are recomputed far more often than the data
+# changes. Cache them keyed on the query plus a write version that every
+# successful insert/delete bumps, so stale entries simply stop matching.
+_SUMMARY_CACHE_MAX = 128
+
+_summary_cache: dict = {}
+_write_version = 0
+
+def _bump_write_version():
+    global _write_version
+    _write_version += 1
+
+def _summary_cache_get(key):
+    return _summary_cache.get(key)
+
+def _summary_cache_put(key, value):
+    if len(_summary_cache) >= _SUMMARY_CACHE_MAX:
+        # Drop the oldest entry (dicts preserve insertion order).
+        _summary_cache.pop(next(iter(_summary_cache)))
+    _summary_cache[key] = value
+
+# ============================================================
+# INPUT VALIDATION
+# ============================================================
+
+# Bad input is cheaper to reject with a plain check and a shared error
+# dict than by letting SQLite raise and formatting an exception.
+_DATE_ERROR = {"status": "error", "message": "date must be in YYYY-MM-DD format"}
+_AMOUNT_ERROR = {"status": "error", "message": "amount must be a number"}
+
+def _valid_date(value) -> bool:
+    """Cheap structural check for YYYY-MM-DD strings."""
+    return (
+        isinstance(value, str)
+        and len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    )
+
+def _valid_amount(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
 
 # ============================================================
 # MCP TOOLS
@@ -88,105 +408,182 @@ async def add_expense(date: str, amount: float, category: str, subcategory: str
         subcategory: Optional subcategory
         note: Optional note
     """
+    if not _valid_date(date):
+        return _DATE_ERROR
+    if not _valid_amount(amount):
+        return _AMOUNT_ERROR
+
     try:
-        await ensure_db()
-        
-        async with aiosqlite.connect(DB_PATH) as db:
-            cur = await db.execute(
-                """
-                INSERT INTO expenses (date, amount, category, subcategory, note)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (date, amount, category, subcategory, note)
+        new_id = await asyncio.to_thread(
+            _insert_expense_sync, date, amount, category, subcategory, note
+        )
+        _bump_write_version()
+
+        return {
+            "status": "success",
+            "id": new_id,
+            "message": f"Expense added: ${amount} for {category}"
+        }
+
+    except (aiosqlite.Error, ValueError) as e:
+        return {"status": "error", "message": str(e)}
+
+
+@mcp.tool()
+async def add_expenses(items: list[dict]):
+    """Add multiple expenses in one call.
+
+    Args:
+        items: List of expenses, each a dict with keys
+            date (required), amount (required), category (required),
+            subcategory (optional), note (optional)
+    """
+    try:
+        if not items:
+            return {"status": "error", "message": "No expenses provided"}
+
+        for item in items:
+            if not _valid_date(item["date"]):
+                return _DATE_ERROR
+            if not _valid_amount(item["amount"]):
+                return _AMOUNT_ERROR
+
+        db = await get_db()
+
+        rows = [
+            (
+                item["date"],
+                item["amount"],
+                item["category"],
+                item.get("subcategory", ""),
+                item.get("note", "")
             )
-            await db.commit()
+            for item in items
+        ]
 
-            return {
-                "status": "success",
-                "id": cur.lastrowid,
-                "message": f"Expense added: ${amount} for {category}"
-            }
+        # One statement reused for every row inside a single explicit
+        # transaction: one fsync for the whole batch, no per-row parse,
+        # and no parameter-count ceiling to chunk around.
+        async with _batch_lock:
+            await db.execute("BEGIN")
+            try:
+                await db.executemany(_SQL_INSERT_EXPENSE, rows)
+                # lastrowid is undefined after executemany; ask SQLite
+                # directly while we still hold the write transaction.
+                cur = await db.execute("SELECT last_insert_rowid()")
+                last_id = (await cur.fetchone())[0]
+                await db.commit()
+                _bump_write_version()
+            except BaseException:
+                # BaseException so a task cancellation mid-batch still
+                # rolls back instead of leaving the transaction open.
+                await db.rollback()
+                raise
 
-    except Exception as e:
+        ids = list(range(last_id - len(rows) + 1, last_id + 1))
+
+        return {
+            "status": "success",
+            "count": len(ids),
+            "ids": ids,
+            "message": f"{len(ids)} expenses added"
+        }
+
+    except KeyError as e:
+        return {"status": "error", "message": f"Missing required field: {e}"}
+    except (aiosqlite.Error, ValueError) as e:
         return {"status": "error", "message": str(e)}
 
 
 @mcp.tool()
-async def list_expenses(start_date: str, end_date: str):
+async def list_expenses(start_date: str, end_date: str, limit: int = 500, offset: int = 0):
     """List expenses in date range.
-    
+
     Args:
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format
+        limit: Maximum number of expenses to return (default 500)
+        offset: Number of expenses to skip, for pagination
     """
+    if not _valid_date(start_date) or not _valid_date(end_date):
+        return _DATE_ERROR
+
     try:
-        await ensure_db()
-        
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with acquire_reader() as db:
             cur = await db.execute(
-                """
-                SELECT id, date, amount, category, subcategory, note
-                FROM expenses
-                WHERE date BETWEEN ? AND ?
-                ORDER BY date DESC
-                """,
-                (start_date, end_date)
+                _SQL_LIST_EXPENSES, (start_date, end_date, limit, offset)
             )
-            rows = await cur.fetchall()
-            cols = [d[0] for d in cur.description]
-            expenses = [dict(zip(cols, r)) for r in rows]
-            
-            return {
-                "status": "success",
-                "count": len(expenses),
-                "expenses": expenses
-            }
+            # Iterate the cursor instead of fetchall() so rows stream
+            # from SQLite without an intermediate tuple list.
+            expenses = [dict(r) async for r in cur]
 
-    except Exception as e:
+        return {
+            "status": "success",
+            "count": len(expenses),
+            "expenses": expenses,
+            "limit": limit,
+            "offset": offset
+        }
+
+    except (aiosqlite.Error, ValueError) as e:
         return {"status": "error", "message": str(e)}
 
 
 @mcp.tool()
-async def summarize_expenses(start_date: str, end_date: str, category: str = None):
+async def summarize_expenses(start_date: str, end_date: str, category: str = None, freshness_seconds: int = 0):
     """Summarize expenses by category.
-    
+
     Args:
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format
         category: Optional category filter
+        freshness_seconds: If > 0 and the range includes today, serve a
+            cached summary up to this many seconds old even across writes
     """
+    if not _valid_date(start_date) or not _valid_date(end_date):
+        return _DATE_ERROR
+
     try:
-        await ensure_db()
-        
-        query = """
-            SELECT category, SUM(amount) AS total, COUNT(*) AS count
-            FROM expenses
-            WHERE date BETWEEN ? AND ?
-        """
-        params = [start_date, end_date]
+        # Write-version keys are exact but miss after every write. For
+        # today-inclusive dashboard ranges, callers can opt into bounded
+        # staleness: snap the key to a fixed time bucket so repeated
+        # polls within the window share one cache entry.
+        if freshness_seconds > 0 and end_date >= _date.today().isoformat():
+            bucket = int(time.time()) // freshness_seconds * freshness_seconds
+            cache_key = (start_date, end_date, category, "bucket", bucket)
+        else:
+            cache_key = (start_date, end_date, category, _write_version)
+        cached = _summary_cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         if category:
-            query += " AND category = ?"
-            params.append(category)
-
-        query += " GROUP BY category ORDER BY total DESC"
+            query = _SQL_SUMMARIZE_BY_CATEGORY
+            params = (start_date, end_date, category)
+        else:
+            query = _SQL_SUMMARIZE
+            params = (start_date, end_date)
 
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with acquire_reader() as db:
             cur = await db.execute(query, params)
             rows = await cur.fetchall()
-            cols = [d[0] for d in cur.description]
-            summary = [dict(zip(cols, r)) for r in rows]
-            
-            total = sum(row['total'] for row in summary)
-            
-            return {
-                "status": "success",
-                "summary": summary,
-                "total": total,
-                "period": f"{start_date} to {end_date}"
-            }
 
-    except Exception as e:
+        total = rows[0]["grand_total"] if rows else 0
+        summary = [
+            {"category": r["category"], "total": r["total"], "count": r["count"]}
+            for r in rows
+        ]
+
+        result = {
+            "status": "success",
+            "summary": summary,
+            "total": total,
+            "period": f"{start_date} to {end_date}"
+        }
+        _summary_cache_put(cache_key, result)
+        return result
+
+    except (aiosqlite.Error, ValueError) as e:
         return {"status": "error", "message": str(e)}
 
 
@@ -198,54 +595,53 @@ async def delete_expense(expense_id: int):
         expense_id: The ID of the expense to delete
     """
     try:
-        await ensure_db()
-        
-        async with aiosqlite.connect(DB_PATH) as db:
-            cur = await db.execute("DELETE FROM expenses WHERE id = ?", (expense_id,))
-            await db.commit()
-            
-            if cur.rowcount == 0:
-                return {"status": "error", "message": f"Expense {expense_id} not found"}
-            
-            return {
-                "status": "success",
-                "message": f"Expense {expense_id} deleted"
-            }
+        deleted = await asyncio.to_thread(_delete_expense_sync, expense_id)
 
-    except Exception as e:
+        if deleted == 0:
+            return {"status": "error", "message": f"Expense {expense_id} not found"}
+
+        _bump_write_version()
+
+        return {
+            "status": "success",
+            "message": f"Expense {expense_id} deleted"
+        }
+
+    except (aiosqlite.Error, ValueError) as e:
         return {"status": "error", "message": str(e)}
 
 # ============================================================
 # MCP RESOURCE
 # ============================================================
 
+@functools.lru_cache(maxsize=1)
+def _read_categories_file(path: str, mtime_ns: int) -> str:
+    """Read the categories file, cached until its mtime changes."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
 @mcp.resource("expense:///categories")
 def get_categories() -> str:
     """Get available expense categories."""
     # In cloud, we can't read from filesystem, so return default
     # In local, try to read from file, fallback to default
-    
-    if not IS_CLOUD:
-        categories_file = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), 
-            "categories.json"
-        )
+
+    if _CATEGORIES_FILE_EXISTS:
         try:
-            if os.path.exists(categories_file):
-                with open(categories_file, "r", encoding="utf-8") as f:
-                    return f.read()
+            # One stat per fetch; the read itself is cached per mtime.
+            mtime_ns = os.stat(_CATEGORIES_FILE).st_mtime_ns
+            return _read_categories_file(_CATEGORIES_FILE, mtime_ns)
         except Exception:
             pass
-    
-    return json.dumps(DEFAULT_CATEGORIES, indent=2)
+
+    return CATEGORIES_JSON
 
 # ============================================================
 # SERVER
 # ============================================================
 
 if __name__ == "__main__":
-    import sys
-    
     # Determine transport based on how it's run
     if len(sys.argv) > 1 and sys.argv[1] == "dev":
         # fastmcp dev mode - uses stdio